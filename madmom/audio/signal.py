@@ -15,6 +15,11 @@ import numpy as np
 from ..processors import BufferProcessor, Processor
 from ..utils import integer_types
 
+SMOOTH_FFT_MIN_KERNEL = 128
+
+# cache for Hamming smoothing kernels (read-only)
+_HAMMING_WINDOWS = {}
+
 
 # signal functions
 def smooth(signal, kernel):
@@ -36,7 +41,8 @@ def smooth(signal, kernel):
     Notes
     -----
     If `kernel` is an integer, a Hamming window of that length will be used
-    as a smoothing kernel.
+    as a smoothing kernel. Kernels with at least `SMOOTH_FFT_MIN_KERNEL`
+    values are applied via FFT based convolution.
 
     """
     # check if a kernel is given
@@ -47,8 +53,12 @@ def smooth(signal, kernel):
         if kernel == 0:
             return signal
         elif kernel > 1:
-            # use a Hamming window of given length
-            kernel = np.hamming(kernel)
+            # use a Hamming window of given length (create it only once)
+            if kernel not in _HAMMING_WINDOWS:
+                window = np.hamming(kernel)
+                window.flags.writeable = False
+                _HAMMING_WINDOWS[kernel] = window
+            kernel = _HAMMING_WINDOWS[kernel]
         else:
             raise ValueError("can't create a smoothing kernel of size %d" %
                              kernel)
@@ -58,13 +68,20 @@ def smooth(signal, kernel):
     else:
         raise ValueError("can't smooth signal with %s" % kernel)
     # convolve with the kernel and return
+    if signal.ndim not in (1, 2):
+        raise ValueError('signal must be either 1D or 2D')
+    # use FFT based convolution for large kernels
+    # Note: np.convolve() returns max(len(signal), len(kernel)) values in
+    #       'same' mode, thus use it for signals shorter than the kernel
+    if len(kernel) >= SMOOTH_FFT_MIN_KERNEL and len(signal) >= len(kernel):
+        from scipy.signal import fftconvolve
+        if signal.ndim == 2:
+            kernel = kernel[:, np.newaxis]
+        return fftconvolve(signal, kernel, 'same')
     if signal.ndim == 1:
         return np.convolve(signal, kernel, 'same')
-    elif signal.ndim == 2:
-        from scipy.signal import convolve2d
-        return convolve2d(signal, kernel[:, np.newaxis], 'same')
-    else:
-        raise ValueError('signal must be either 1D or 2D')
+    from scipy.signal import convolve2d
+    return convolve2d(signal, kernel[:, np.newaxis], 'same')
 
 
 def adjust_gain(signal, gain):
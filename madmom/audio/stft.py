@@ -24,6 +24,7 @@ from ..processors import Processor
 from .signal import Signal, FramedSignal
 
 STFT_DTYPE = np.complex64
+STFT_BLOCK_SIZE = 256
 
 
 def fft_frequencies(num_fft_bins, sample_rate):
@@ -46,6 +47,50 @@ def fft_frequencies(num_fft_bins, sample_rate):
     return np.fft.fftfreq(num_fft_bins * 2, 1. / sample_rate)[:num_fft_bins]
 
 
+def _fft_signal(frames, window, fft_size, circular_shift):
+    """
+    Prepare the frame(s) of a signal for the FFT.
+
+    Parameters
+    ----------
+    frames : numpy array, shape (frame_size,) or (num_frames, frame_size)
+        Signal frame(s).
+    window : numpy array, shape (frame_size,)
+        Window (function).
+    fft_size : int
+        FFT size.
+    circular_shift : bool
+        Circular shift the frames.
+
+    Returns
+    -------
+    numpy array
+        Windowed (and circular shifted) frame(s).
+
+    """
+    if circular_shift:
+        # if we need to circular shift the signal for correct phase, we
+        # first multiply the signal frame with the window (or just use it
+        # as it is if no window function is given)
+        if window is not None:
+            signal = np.multiply(frames, window)
+        else:
+            signal = frames
+        # then swap the two halves of the windowed signal; if the FFT size
+        # is bigger than the frame size, we need to pad the (windowed)
+        # signal with additional zeros in between the two halves
+        fft_shift = frames.shape[-1] >> 1
+        fft_signal = np.zeros(frames.shape[:-1] + (fft_size, ))
+        fft_signal[..., :fft_shift] = signal[..., fft_shift:]
+        fft_signal[..., -fft_shift:] = signal[..., :fft_shift]
+        return fft_signal
+    # multiply the signal frame with the window and or return it directly
+    # (i.e. bypass the additional copying step above)
+    if window is not None:
+        return np.multiply(frames, window)
+    return frames
+
+
 def stft(frames, window, fft_size=None, circular_shift=False,
          include_nyquist=False, fftw=None):
     """
@@ -94,41 +139,23 @@ def stft(frames, window, fft_size=None, circular_shift=False,
     if include_nyquist:
         num_fft_bins += 1
 
-    # size of the FFT circular shift (needed for correct phase)
-    if circular_shift:
-        fft_shift = frame_size >> 1
-
     # init objects
     data = np.empty((num_frames, num_fft_bins), STFT_DTYPE)
 
-    # iterate over all frames
-    for f, frame in enumerate(frames):
-        if circular_shift:
-            # if we need to circular shift the signal for correct phase, we
-            # first multiply the signal frame with the window (or just use it
-            # as it is if no window function is given)
-            if window is not None:
-                signal = np.multiply(frame, window)
-            else:
-                signal = frame
-            # then swap the two halves of the windowed signal; if the FFT size
-            # is bigger than the frame size, we need to pad the (windowed)
-            # signal with additional zeros in between the two halves
-            fft_signal = np.zeros(fft_size)
-            fft_signal[:fft_shift] = signal[fft_shift:]
-            fft_signal[-fft_shift:] = signal[:fft_shift]
-        else:
-            # multiply the signal frame with the window and or save it directly
-            # to fft_signal (i.e. bypass the additional copying step above)
-            if window is not None:
-                fft_signal = np.multiply(frame, window)
-            else:
-                fft_signal = frame
+    # FFTW objects are planned for single frames, thus iterate over all frames
+    if fftw:
+        for f, frame in enumerate(frames):
+            data[f] = fftw(_fft_signal(frame, window, fft_size,
+                                       circular_shift))[:num_fft_bins]
+        return data
+    # otherwise process blocks of frames to reduce the FFT call overhead
+    for start in range(0, num_frames, STFT_BLOCK_SIZE):
+        stop = min(start + STFT_BLOCK_SIZE, num_frames)
+        block = np.array([frames[f] for f in range(start, stop)])
+        fft_signal = _fft_signal(block, window, fft_size, circular_shift)
         # perform DFT
-        if fftw:
-            data[f] = fftw(fft_signal)[:num_fft_bins]
-        else:
-            data[f] = fftpack.fft(fft_signal, fft_size, axis=0)[:num_fft_bins]
+        data[start:stop] = fftpack.fft(fft_signal, fft_size,
+                                       axis=-1)[:, :num_fft_bins]
     # return STFT
     return data
 
@@ -16,6 +16,12 @@ import numpy as np
 from ..audio.signal import smooth as smooth_signal
 from ..processors import BufferProcessor, OnlineProcessor
 
+try:
+    # scipy >= 1.4 computes single precision FFTs
+    from scipy.fft import rfft, irfft
+except ImportError:
+    from numpy.fft import rfft, irfft
+
 METHOD = 'comb'
 ALPHA = 0.79
 MIN_BPM = 40.
@@ -24,6 +30,7 @@ ACT_SMOOTH = 0.14
 HIST_SMOOTH = 9
 HIST_BUFFER = 10.
 NO_TEMPO = np.nan
+ACF_FFT_MIN_FRAMES = 256
 
 
 # helper functions
@@ -93,15 +100,32 @@ def interval_histogram_acf(activations, min_tau=1, max_tau=None):
     if max_tau is None:
         max_tau = len(activations) - min_tau
     # test all possible delays
-    taus = list(range(min_tau, max_tau + 1))
-    bins = []
-    # Note: this is faster than:
-    #   corr = np.correlate(activations, activations, mode='full')
-    #   bins = corr[len(activations) + min_tau - 1: len(activations) + max_tau]
-    for tau in taus:
-        bins.append(np.sum(np.abs(activations[tau:] * activations[0:-tau])))
+    taus = np.arange(min_tau, max_tau + 1)
+    # Note: |a * b| = |a| * |b|, thus compute the absolute values only once;
+    #       single precision is sufficient for (beat) activations
+    act = np.abs(activations, dtype=np.float32)
+    num_frames = len(act)
+    if num_frames == 0:
+        # nothing to correlate, all bins are zero
+        corr = np.zeros(0)
+    elif num_frames < ACF_FFT_MIN_FRAMES:
+        # for short signals the direct computation is faster
+        corr = np.correlate(act, act, mode='full')[num_frames - 1:]
+    else:
+        # compute the auto-correlation via FFT; zero-pad the signal to (at
+        # least) twice its length to avoid circular wrap-around
+        fft_size = 1 << (2 * num_frames - 1).bit_length()
+        fft = rfft(act, fft_size)
+        corr = irfft(fft * fft.conj(), fft_size)[:num_frames]
+        # the auto-correlation of non-negative values is non-negative, thus
+        # remove negative numerical noise of the FFT
+        np.maximum(corr, 0, out=corr)
+    # delays exceeding the length of the signal do not correlate at all
+    bins = np.zeros(len(taus))
+    valid = taus < num_frames
+    bins[valid] = corr[taus[valid]]
     # return histogram
-    return np.array(bins), np.array(taus)
+    return bins, taus
 
 
 def interval_histogram_comb(activations, alpha, min_tau=1, max_tau=None):
@@ -212,14 +236,15 @@ def detect_tempo(histogram, fps):
         relative strengths (second column).
 
     """
-    from scipy.signal import argrelmax
     # histogram of IBIs
     bins = histogram[0]
     # convert the histogram bin delays to tempi in beats per minute
     tempi = 60.0 * fps / histogram[1]
     # to get the two dominant tempi, just keep the peaks
-    # use 'wrap' mode to also get peaks at the borders
-    peaks = argrelmax(bins, mode='wrap')[0]
+    # wrap around to also get peaks at the borders
+    # Note: this is the same as scipy.signal.argrelmax(bins, mode='wrap')
+    peaks = np.nonzero((bins > np.roll(bins, 1)) &
+                       (bins > np.roll(bins, -1)))[0]
     # we need more than 1 peak to report multiple tempi
     if len(peaks) == 0:
         # a flat histogram has no peaks, use the center bin
@@ -238,7 +263,7 @@ def detect_tempo(histogram, fps):
         strengths = bins[sorted_peaks]
         strengths /= np.sum(strengths)
         # return the tempi and their normalized strengths
-        ret = np.asarray(list(zip(tempi[sorted_peaks], strengths)))
+        ret = np.vstack((tempi[sorted_peaks], strengths)).T
     # return the tempi
     return np.atleast_2d(ret)
 
@@ -383,8 +408,10 @@ class CombFilterTempoHistogramProcessor(TempoHistogramProcessor):
         # reset to initial state
         if reset:
             self.reset()
+        # the intervals are needed for every frame, compute them only once
+        intervals = self.intervals
         # indices at which to retrieve y[n - τ]
-        idx = [-self.intervals, np.arange(len(self.intervals))]
+        idx = [-intervals, np.arange(len(intervals))]
         # iterate over all activations
         for act in activations:
             # online feed backward comb filter (y[n] = x[n] + α * y[n - τ])
@@ -399,7 +426,7 @@ class CombFilterTempoHistogramProcessor(TempoHistogramProcessor):
             # shift buffer and put new bins at end of buffer
             bins = self._hist_buffer(bins)
         # build a histogram together with the intervals and return it
-        return np.sum(bins, axis=0), self.intervals
+        return np.sum(bins, axis=0), intervals
 
 
 class ACFTempoHistogramProcessor(TempoHistogramProcessor):
@@ -480,18 +507,35 @@ class ACFTempoHistogramProcessor(TempoHistogramProcessor):
         # reset to initial state
         if reset:
             self.reset()
-        # iterate over all activations
-        # TODO: speed this up!
-        for act in activations:
-            # online ACF (y[n] = x[n] * x[n - τ])
-            bins = act * self._act_buffer[-self.intervals].T
-            # shift activation buffer with new value
-            self._act_buffer(act)
-            # use a buffer to only keep a certain number of bins
-            # shift buffer and put new bins at end of buffer
-            bins = self._hist_buffer(bins)
+        activations = np.atleast_1d(np.asarray(activations, dtype=np.float))
+        if activations.ndim != 1:
+            raise NotImplementedError('too many dimensions for online '
+                                      'autocorrelation interval histogram '
+                                      'calculation.')
+        intervals = self.intervals
+        num_frames = len(activations)
+        # without new activations the histogram does not change
+        if num_frames == 0:
+            return np.sum(self._hist_buffer.data, axis=0), intervals
+        # prepend the buffered activations, so that all delayed activations
+        # x[n - τ] can be looked up at once
+        act_buffer = self._act_buffer.data.ravel()
+        buffer_size = len(act_buffer)
+        act = np.hstack((act_buffer, activations))
+        # only the last bins are kept by the histogram buffer, thus compute
+        # them only for the frames which end up in the buffer
+        num_bins = min(num_frames, len(self._hist_buffer.data))
+        frames = np.arange(num_frames - num_bins, num_frames) + buffer_size
+        # online ACF (y[n] = x[n] * x[n - τ]) for all frames at once
+        bins = act[frames, np.newaxis] * \
+            act[frames[:, np.newaxis] - intervals]
+        # shift activation buffer with new values
+        self._act_buffer(act[-min(num_frames, buffer_size):, np.newaxis])
+        # use a buffer to only keep a certain number of bins
+        # shift buffer and put new bins at end of buffer
+        bins = self._hist_buffer(bins)
         # build a histogram together with the intervals and return it
-        return np.sum(bins, axis=0), self.intervals
+        return np.sum(bins, axis=0), intervals
 
 
 class DBNTempoHistogramProcessor(TempoHistogramProcessor):
@@ -33,8 +33,16 @@ def average_predictions(predictions):
     """
     # average predictions if needed
     if len(predictions) > 1:
-        # average the predictions
-        predictions = sum(predictions) / len(predictions)
+        # average the predictions, accumulate them in-place to avoid
+        # allocating a temporary array for each summand; use a dtype wide
+        # enough for all predictions to not downcast any of them
+        num_predictions = len(predictions)
+        dtype = np.result_type(np.float32, *predictions)
+        average = np.array(predictions[0], dtype=dtype)
+        for prediction in predictions[1:]:
+            average += prediction
+        average /= num_predictions
+        predictions = average
     else:
         # nothing to average since we have only one prediction
         predictions = predictions[0]
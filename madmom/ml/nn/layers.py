@@ -283,6 +283,36 @@ class Gate(RecurrentLayer):
         """
         # weight input and add bias
         out = np.dot(data, self.weights) + self.bias
+        # add peephole and recurrent connections and apply activation function
+        return self._activate(out, prev, state)
+
+    def _activate(self, out, prev, state=None):
+        """
+        Activate the gate with the already weighted input data, state (if
+        peephole connections are used) and the previous output (if recurrent
+        connections are used).
+
+        Parameters
+        ----------
+        out : numpy array, shape (num_hiddens,)
+            Weighted input data (including bias) for the gate; it is modified
+            in-place.
+        prev : scalar or numpy array, shape (num_hiddens,)
+            Output data of the previous time step.
+        state : scalar or numpy array, shape (num_hiddens,)
+            State data of the {current | previous} time step.
+
+        Returns
+        -------
+        numpy array, shape (num_hiddens,)
+            Activations of the gate for this data.
+
+        Notes
+        -----
+        Splitting the input weighting from the activation allows layers to
+        weight the input of all time steps at once.
+
+        """
         # add the previous state weighted by the peephole
         if self.peephole_weights is not None:
             out += state * self.peephole_weights
@@ -421,26 +451,31 @@ class LSTMLayer(RecurrentLayer):
         size = len(data)
         # output matrix for the whole sequence
         out = np.zeros((size, self.cell.bias.size), dtype=NN_DTYPE)
+        # weight the input data of all time steps at once (single matrix
+        # multiplication per gate), only the recurrent connections must be
+        # computed step by step
+        ig_in = np.dot(data, self.input_gate.weights) + self.input_gate.bias
+        fg_in = np.dot(data, self.forget_gate.weights) + self.forget_gate.bias
+        cell_in = np.dot(data, self.cell.weights) + self.cell.bias
+        og_in = np.dot(data, self.output_gate.weights) + self.output_gate.bias
         # process the input data
         for i in range(size):
-            # cache input data
-            data_ = data[i]
             # input gate:
             # operate on current data, previous output and state
-            ig = self.input_gate.activate(data_, self._prev, self._state)
+            ig = self.input_gate._activate(ig_in[i], self._prev, self._state)
             # forget gate:
             # operate on current data, previous output and state
-            fg = self.forget_gate.activate(data_, self._prev, self._state)
+            fg = self.forget_gate._activate(fg_in[i], self._prev, self._state)
             # cell:
             # operate on current data and previous output
-            cell = self.cell.activate(data_, self._prev)
+            cell = self.cell._activate(cell_in[i], self._prev)
             # internal state:
             # weight the cell with the input gate
             # and add the previous state weighted by the forget gate
             self._state = cell * ig + self._state * fg
             # output gate:
             # operate on current data, previous output and current state
-            og = self.output_gate.activate(data_, self._prev, self._state)
+            og = self.output_gate._activate(og_in[i], self._prev, self._state)
             # output:
             # apply activation function to state and weight by output gate
             out[i] = self.activation_fn(self._state) * og
@@ -510,6 +545,30 @@ class GRUCell(Cell):
         """
         # weight input and add bias
         out = np.dot(data, self.weights) + self.bias
+        # add recurrent connection and apply activation function
+        return self._activate(out, prev, reset_gate)
+
+    def _activate(self, out, prev, reset_gate):
+        """
+        Activate the cell with the already weighted input, previous output and
+        reset gate.
+
+        Parameters
+        ----------
+        out : numpy array, shape (num_hiddens,)
+            Weighted input data (including bias) for the cell; it is modified
+            in-place.
+        prev : numpy array, shape (num_hiddens,)
+            Output of the previous time step.
+        reset_gate : numpy array, shape (num_hiddens,)
+            Activation of the reset gate.
+
+        Returns
+        -------
+        numpy array, shape (num_hiddens,)
+            Activations of the cell for this data.
+
+        """
         # weight previous cell output and reset gate
         out += reset_gate * np.dot(prev, self.recurrent_weights)
         # apply activation function and return it
@@ -624,19 +683,23 @@ class GRULayer(RecurrentLayer):
         size = len(data)
         # output matrix for the whole sequence
         out = np.zeros((size, self.cell.bias.size), dtype=NN_DTYPE)
+        # weight the input data of all time steps at once (single matrix
+        # multiplication per gate), only the recurrent connections must be
+        # computed step by step
+        rg_in = np.dot(data, self.reset_gate.weights) + self.reset_gate.bias
+        ug_in = np.dot(data, self.update_gate.weights) + self.update_gate.bias
+        cell_in = np.dot(data, self.cell.weights) + self.cell.bias
         # process the input data
         for i in range(size):
-            # cache input data
-            data_ = data[i]
             # reset gate:
             # operate on current data and previous output
-            rg = self.reset_gate.activate(data_, self._prev)
+            rg = self.reset_gate._activate(rg_in[i], self._prev)
             # update gate:
             # operate on current data and previous output
-            ug = self.update_gate.activate(data_, self._prev)
+            ug = self.update_gate._activate(ug_in[i], self._prev)
             # cell (implemented as in [1]):
             # operate on current data, previous output and reset gate
-            cell = self.cell.activate(data_, self._prev, rg)
+            cell = self.cell._activate(cell_in[i], self._prev, rg)
             # output:
             out[i] = ug * cell + (1 - ug) * self._prev
             # set reference to current output
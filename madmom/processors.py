@@ -451,6 +451,7 @@ class ParallelProcessor(SequentialProcessor):
         # number of threads
         if num_threads is None:
             num_threads = 1
+        self.num_threads = num_threads
         # Note: we must define the map function here, otherwise it leaks both
         #       memory and file descriptors if we init the pool in the process
         #       method. This also means that we must use only 1 thread if we
@@ -481,8 +482,14 @@ class ParallelProcessor(SequentialProcessor):
         if len(self.processors) == 1:
             return [_process((self.processors[0], data, kwargs))]
         # process data in parallel and return a list with processed data
-        return list(self.map(_process, zip(self.processors, it.repeat(data),
-                                           it.repeat(kwargs))))
+        tasks = zip(self.processors, it.repeat(data), it.repeat(kwargs))
+        if self.map is map:
+            return list(self.map(_process, tasks))
+        # distribute the processors evenly among the threads; all tasks of a
+        # chunk are pickled together, thus the data gets copied only once to
+        # each thread instead of once for each processor
+        chunksize = int(np.ceil(len(self.processors) / self.num_threads))
+        return list(self.map(_process, tasks, chunksize))
 
 
 class IOProcessor(OutputProcessor):
@@ -612,26 +619,41 @@ class _ParallelProcess(mp.Process):
     Parameters
     ----------
     task_queue :
-        Queue with tasks, i.e. tuples ('processor', 'infile', 'outfile')
+        Queue with tasks, i.e. tuples ('infile', 'outfile')
+    processor : :class:`Processor` instance
+        Processor used to process all tasks.
+    kwargs : dict, optional
+        Keyword arguments passed to the processor.
 
     Notes
     -----
     Usually, multiple instances are created via :func:`process_batch`.
 
+    The processor is handed to the process only once when it is started
+    (instead of being pickled together with each task). Each task is
+    processed with a fresh copy of it, thus state cached by the processor
+    (e.g. a filterbank depending on the sample rate) is not carried over to
+    the next file.
+
     """
-    def __init__(self, task_queue):
+    def __init__(self, task_queue, processor, **kwargs):
         super(_ParallelProcess, self).__init__()
         self.task_queue = task_queue
+        self.processor = processor
+        self.kwargs = kwargs
 
     def run(self):
         """Process all tasks from the task queue."""
+        from copy import deepcopy
         from .audio.signal import LoadAudioFileError
         while True:
             # get the task tuple
-            processor, infile, outfile, kwargs = self.task_queue.get()
+            infile, outfile = self.task_queue.get()
             try:
-                # process the Processor with the data
-                _process((processor, infile, outfile, kwargs))
+                # process a copy of the Processor with the data, so that no
+                # state is kept between files
+                processor = deepcopy(self.processor)
+                _process((processor, infile, outfile, self.kwargs))
             except LoadAudioFileError as e:
                 print(e)
             # signal that it is done
@@ -688,8 +710,10 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
 
     # create task queue
     tasks = mp.JoinableQueue()
-    # create working threads
-    processes = [_ParallelProcess(tasks) for _ in range(num_workers)]
+    # create working threads (no need to start more than files to process)
+    num_workers = min(num_workers, len(files))
+    processes = [_ParallelProcess(tasks, processor, **kwargs)
+                 for _ in range(num_workers)]
     for p in processes:
         p.daemon = True
         p.start()
@@ -713,7 +737,7 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
         if output_suffix is not None:
             output_file += output_suffix
         # put processing tasks in the queue
-        tasks.put((processor, input_file, output_file, kwargs))
+        tasks.put((input_file, output_file))
     # wait for all processing tasks to finish
     tasks.join()
 
@@ -479,16 +479,16 @@ def expand_notes(notes, duration=0.6, velocity=100):
     rows, columns = notes.shape
     if columns == 4:
         return notes
-    elif columns == 3:
-        new_columns = np.ones((rows, 1)) * velocity
-    elif columns == 2:
-        new_columns = np.ones((rows, 2)) * velocity
-        new_columns[:, 0] = duration
-    else:
+    elif columns not in (2, 3):
         raise ValueError('unable to handle `notes` with %d columns' % columns)
+    # allocate the expanded notes once and fill in the missing columns
+    expanded = np.empty((rows, 4), dtype=np.result_type(notes, np.float))
+    expanded[:, :columns] = notes
+    if columns == 2:
+        expanded[:, 2] = duration
+    expanded[:, 3] = velocity
     # return the notes
-    notes = np.hstack((notes, new_columns))
-    return notes
+    return expanded
 
 
 # argparse action to set and overwrite default lists
@@ -46,6 +46,21 @@ class TestSmoothFunction(unittest.TestCase):
         self.assertTrue(len(result) == len(sig_2d))
         self.assertTrue(result.shape == sig_2d.shape)
 
+    def test_fft_convolution(self):
+        # large kernels are applied via FFT, results must not differ
+        sig = np.random.random((500, 2))
+        kernel = np.hamming(SMOOTH_FFT_MIN_KERNEL + 1)
+        result = smooth(sig[:, 0], kernel)
+        self.assertTrue(np.allclose(result,
+                                    np.convolve(sig[:, 0], kernel, 'same')))
+        result = smooth(sig, kernel)
+        self.assertTrue(result.shape == sig.shape)
+        self.assertTrue(np.allclose(result[:, 1],
+                                    np.convolve(sig[:, 1], kernel, 'same')))
+        # signals shorter than the kernel
+        result = smooth(sig[:10, 0], kernel)
+        self.assertTrue(len(result) == len(kernel))
+
     def test_errors(self):
         with self.assertRaises(ValueError):
             smooth(np.zeros(9).reshape(3, 3), -1)
@@ -48,6 +48,37 @@ class TestIntervalHistogramAcfFunction(unittest.TestCase):
                                                   0.17694432, 0.24372872]))
         self.assertTrue(np.allclose(hist[1], np.arange(24, 151)))
 
+    def test_short_signal(self):
+        # direct and FFT based computation must yield the same results
+        # (within single precision, i.e. relative to the histogram maximum)
+        act_short = act[:ACF_FFT_MIN_FRAMES - 1]
+        hist = interval_histogram_acf(act_short, min_tau=24, max_tau=300)
+        hist_fft = interval_histogram_acf(
+            np.hstack((act_short, np.zeros(1))), min_tau=24, max_tau=300)
+        atol = 1e-6 * hist[0].max()
+        self.assertTrue(np.allclose(hist[0], hist_fft[0], atol=atol))
+        # delays exceeding the signal length do not contribute
+        self.assertTrue(np.allclose(hist[0][-46:], 0))
+
+    def test_non_negative(self):
+        # sparse pulse train, most delays do not correlate at all
+        pulses = np.zeros(3000)
+        pulses[::100] = 1
+        hist = interval_histogram_acf(pulses, min_tau=24, max_tau=150)
+        self.assertTrue(np.all(hist[0] >= 0))
+        # single precision FFT noise is relative to the histogram maximum
+        atol = 1e-6 * hist[0].max()
+        self.assertTrue(np.allclose(hist[0][hist[1] != 100], 0, atol=atol))
+        self.assertTrue(np.allclose(hist[0][hist[1] == 100], 29))
+
+    def test_empty_signal(self):
+        hist = interval_histogram_acf(np.zeros(0), min_tau=24, max_tau=150)
+        self.assertTrue(np.allclose(hist[0], np.zeros(127)))
+        self.assertTrue(np.allclose(hist[1], np.arange(24, 151)))
+        hist = interval_histogram_acf(np.zeros(0))
+        self.assertEqual(len(hist[0]), 0)
+        self.assertEqual(len(hist[1]), 0)
+
 
 class TestIntervalHistogramCombFunction(unittest.TestCase):
 
@@ -333,6 +364,34 @@ class TestACFTempoHistogramProcessorClass(unittest.TestCase):
         self.assertTrue(np.allclose(hist, hist_offline))
         self.assertTrue(np.allclose(delays, delays_offline))
 
+    def test_process_online_chunks(self):
+        # process the activations in chunks of different lengths, also longer
+        # than the activation and histogram buffers; the histogram must be
+        # the same as when processing frame by frame
+        activations = np.tile(act, 8)
+        for hist_buffer in (0.05, 1, 10):
+            for chunks in ([7, 3, 1, 400, 2], [5, 1500, 30]):
+                processor = ACFTempoHistogramProcessor(
+                    fps=fps, hist_buffer=hist_buffer, online=True)
+                reference = ACFTempoHistogramProcessor(
+                    fps=fps, hist_buffer=hist_buffer, online=True)
+                start = 0
+                for chunk in chunks:
+                    chunk_act = activations[start:start + chunk]
+                    hist = processor(chunk_act, reset=False)
+                    for a in chunk_act:
+                        hist_ref = reference(np.atleast_1d(a), reset=False)
+                    start += chunk
+                    self.assertTrue(np.allclose(hist[0], hist_ref[0]))
+                    self.assertTrue(np.allclose(hist[1], hist_ref[1]))
+                # empty chunks do not alter the histogram
+                hist_empty = processor(np.zeros(0), reset=False)
+                self.assertTrue(np.allclose(hist_empty[0], hist[0]))
+
+    def test_process_online_errors(self):
+        with self.assertRaises(NotImplementedError):
+            self.online_processor(np.vstack((act, act)).T)
+
 
 class TestDBNTempoHistogramProcessorClass(unittest.TestCase):
 
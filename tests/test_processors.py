@@ -6,16 +6,26 @@ This file contains tests for the madmom.processors module.
 """
 
 from __future__ import absolute_import, division, print_function
+import os
+import shutil
 import tempfile
 import unittest
 
 from madmom.processors import *
 from madmom.models import *
 from madmom.ml.nn import NeuralNetwork
+from madmom.audio.spectrogram import FilteredSpectrogramProcessor
+
+from . import AUDIO_PATH
 
 tmp_file = tempfile.NamedTemporaryFile(delete=False).name
 
 
+def _save(data, output):
+    np.save(output, data)
+    return data
+
+
 class TestProcessor(unittest.TestCase):
 
     def test_unicode(self):
@@ -78,6 +88,54 @@ class TestBufferProcessor(unittest.TestCase):
         self.assertTrue(np.allclose(buffer.data, 1))
 
 
+class TestParallelProcessor(unittest.TestCase):
+
+    def test_process(self):
+        data = np.arange(10.)
+        processors = [np.sum, np.max, np.min]
+        result = ParallelProcessor(processors)(data)
+        self.assertEqual(result, [45, 9, 0])
+        # process in parallel, results must be the same and in order
+        result = ParallelProcessor(processors, num_threads=2)(data)
+        self.assertEqual(result, [45, 9, 0])
+        # more threads than processors
+        result = ParallelProcessor(processors, num_threads=8)(data)
+        self.assertEqual(result, [45, 9, 0])
+
+    def test_process_uneven_split(self):
+        data = np.arange(10.)
+        processors = [np.sum, np.max, np.min, np.mean, len]
+        # processors can not be distributed evenly among the threads
+        result = ParallelProcessor(processors, num_threads=2)(data)
+        self.assertEqual(result, [45, 9, 0, 4.5, 10])
+        result = ParallelProcessor(processors, num_threads=3)(data)
+        self.assertEqual(result, [45, 9, 0, 4.5, 10])
+
+
+class TestProcessBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_mixed_sample_rates(self):
+        files = [os.path.join(AUDIO_PATH, 'sample.wav'),
+                 os.path.join(AUDIO_PATH, 'sample_22050.wav')]
+        processor = IOProcessor(FilteredSpectrogramProcessor(), _save)
+        # a single worker processes all files, the filterbank cached for the
+        # first file must not be used for the second one
+        process_batch(processor, files, output_dir=self.tmp_dir,
+                      output_suffix='.npy', num_workers=1)
+        for f in files:
+            result = np.load(os.path.join(
+                self.tmp_dir, os.path.basename(f).replace('.wav', '.npy')))
+            expected = FilteredSpectrogramProcessor()(f)
+            self.assertEqual(result.shape, expected.shape)
+            self.assertTrue(np.allclose(result, expected))
+
+
 # clean up
 def teardown_module():
     import os